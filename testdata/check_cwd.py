@@ -1,25 +1,61 @@
 #!/usr/bin/env python3
 import os
 import json
+import re
 import sys
 
-for line in sys.stdin:
-    request = json.loads(line.strip())
-    if request.get('method') == 'initialize':
+# The initialize response is static, only the id changes
+PREFIX = b'{"jsonrpc": "2.0", "id": '
+SUFFIX = b', "result": ' + json.dumps({
+    'protocolVersion': '2024-11-05',
+    'capabilities': {},
+    'serverInfo': {
+        'name': 'cwd-test',
+        'version': '1.0.0'
+    }
+}).encode('utf-8') + b'}\n'
+
+# Compact envelope with an integer id directly followed by the method
+ENVELOPE_RE = re.compile(rb'^\{"jsonrpc":"2\.0","id":(-?\d+),"method":"([^"\\]*)"[,}]')
+
+def read_lines(stream=sys.stdin.buffer, size=65536):
+    buf = bytearray()
+    while True:
+        chunk = stream.read1(size)
+        if not chunk:
+            break
+        buf += chunk
+        while (i := buf.find(b'\n')) != -1:
+            yield bytes(buf[:i])
+            del buf[:i + 1]
+    if buf:
+        yield bytes(buf)
+
+def main():
+    loads = json.loads
+    dumps = json.dumps
+    write = sys.stdout.buffer.write
+    flush = sys.stdout.buffer.flush
+
+    envelope_match = ENVELOPE_RE.match
+
+    for line in read_lines():
+        envelope = envelope_match(line)
+        if envelope:
+            if envelope.group(2) != b'initialize':
+                continue
+            request_id = envelope.group(1)
+        else:
+            request = loads(line)
+            if request.get('method') != 'initialize':
+                continue
+            request_id = dumps(request['id']).encode('utf-8')
+
         cwd = os.getcwd()
-        response = {
-            'jsonrpc': '2.0',
-            'id': request['id'],
-            'result': {
-                'protocolVersion': '2024-11-05',
-                'capabilities': {},
-                'serverInfo': {
-                    'name': 'cwd-test',
-                    'version': '1.0.0'
-                }
-            }
-        }
         # The test will verify the working directory via configuration
-        sys.stdout.write(json.dumps(response) + '\n')
-        sys.stdout.flush()
+        write(PREFIX + request_id + SUFFIX)
+        flush()
+
+if __name__ == '__main__':
+    main()
 
@@ -1,19 +1,52 @@
 #!/usr/bin/env python3
 import json
+import re
 import sys
 
-for line in sys.stdin:
-    request = json.loads(line.strip())
-    if 'id' in request:
-        response = {
-            'jsonrpc': '2.0',
-            'id': request['id'],
-            'error': {
-                'code': -32600,
-                'message': 'Invalid Request',
-                'data': 'Test error'
-            }
-        }
-        sys.stdout.write(json.dumps(response) + '\n')
-        sys.stdout.flush()
+# Every reply is the same error, only the id changes
+PREFIX = b'{"jsonrpc": "2.0", "id": '
+SUFFIX = b', "error": ' + json.dumps({
+    'code': -32600,
+    'message': 'Invalid Request',
+    'data': 'Test error'
+}).encode('utf-8') + b'}\n'
+
+# Compact envelope opening with an integer id
+ID_RE = re.compile(rb'^\{"jsonrpc":"2\.0","id":(-?\d+)[,}]')
+
+def read_lines(stream=sys.stdin.buffer, size=65536):
+    buf = bytearray()
+    while True:
+        chunk = stream.read1(size)
+        if not chunk:
+            break
+        buf += chunk
+        while (i := buf.find(b'\n')) != -1:
+            yield bytes(buf[:i])
+            del buf[:i + 1]
+    if buf:
+        yield bytes(buf)
+
+def main():
+    loads = json.loads
+    dumps = json.dumps
+    write = sys.stdout.buffer.write
+    flush = sys.stdout.buffer.flush
+    id_match = ID_RE.match
+
+    for line in read_lines():
+        match = id_match(line)
+        if match:
+            request_id = match.group(1)
+        else:
+            request = loads(line)
+            if 'id' not in request:
+                continue
+            request_id = dumps(request['id']).encode('utf-8')
+
+        write(PREFIX + request_id + SUFFIX)
+        flush()
+
+if __name__ == '__main__':
+    main()
 
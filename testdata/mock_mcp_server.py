@@ -2,128 +2,122 @@
 import json
 import sys
 
+_out = sys.stdout.buffer.write
+_flush = sys.stdout.buffer.flush
+
+def read_batches(stream=sys.stdin.buffer, size=65536):
+    buf = bytearray()
+    while True:
+        chunk = stream.read1(size)
+        if not chunk:
+            break
+        buf += chunk
+        i = buf.rfind(b'\n')
+        if i != -1:
+            yield bytes(buf[:i]).split(b'\n')
+            del buf[:i + 1]
+    if buf:
+        yield [bytes(buf)]
+
 def send_response(response):
-    sys.stdout.write(json.dumps(response) + '\n')
-    sys.stdout.flush()
+    _out(response)
+    _out(b'\n')
 
-def handle_request(request):
-    method = request.get('method')
-    req_id = request.get('id')
+# Responses are static, so each one is pre-serialized around the id slot
+def make_template(body, key='result'):
+    return (
+        b'{"jsonrpc": "2.0", "id": ',
+        b', "' + key.encode('utf-8') + b'": ' + json.dumps(body).encode('utf-8') + b'}'
+    )
 
-    if method == 'initialize':
-        return {
-            'jsonrpc': '2.0',
-            'id': req_id,
-            'result': {
-                'protocolVersion': '2024-11-05',
-                'capabilities': {},
-                'serverInfo': {
-                    'name': 'mock-server',
-                    'version': '1.0.0',
-                    'protocolVersion': '2024-11-05'
-                }
-            }
-        }
-    elif method == 'tools/list':
-        return {
-            'jsonrpc': '2.0',
-            'id': req_id,
-            'result': {
-                'tools': [{
-                    'name': 'test_tool',
-                    'description': 'A test tool',
-                    'inputSchema': {'type': 'object'}
-                }]
-            }
-        }
-    elif method == 'tools/call':
-        return {
-            'jsonrpc': '2.0',
-            'id': req_id,
-            'result': {
-                'content': [{
-                    'type': 'text',
-                    'text': 'Tool result for test'
-                }],
-                'isError': False
-            }
-        }
-    elif method == 'prompts/list':
-        return {
-            'jsonrpc': '2.0',
-            'id': req_id,
-            'result': {
-                'prompts': [{
-                    'name': 'test_prompt',
-                    'description': 'A test prompt'
-                }]
-            }
-        }
-    elif method == 'prompts/get':
-        return {
-            'jsonrpc': '2.0',
-            'id': req_id,
-            'result': {
-                'description': 'Test prompt',
-                'messages': [{
-                    'role': 'user',
-                    'content': {'type': 'text', 'text': 'Test message'}
-                }]
-            }
-        }
-    elif method == 'resources/list':
-        return {
-            'jsonrpc': '2.0',
-            'id': req_id,
-            'result': {
-                'resources': [{
-                    'uri': 'test://resource',
-                    'name': 'test_resource',
-                    'description': 'A test resource',
-                    'mimeType': 'text/plain'
-                }]
-            }
-        }
-    elif method == 'resources/read':
-        return {
-            'jsonrpc': '2.0',
-            'id': req_id,
-            'result': {
-                'contents': [{
-                    'uri': 'test://resource',
-                    'mimeType': 'text/plain',
-                    'text': 'Resource content'
-                }]
-            }
+TEMPLATES = {
+    'initialize': make_template({
+        'protocolVersion': '2024-11-05',
+        'capabilities': {},
+        'serverInfo': {
+            'name': 'mock-server',
+            'version': '1.0.0',
+            'protocolVersion': '2024-11-05'
         }
+    }),
+    'tools/list': make_template({
+        'tools': [{
+            'name': 'test_tool',
+            'description': 'A test tool',
+            'inputSchema': {'type': 'object'}
+        }]
+    }),
+    'tools/call': make_template({
+        'content': [{
+            'type': 'text',
+            'text': 'Tool result for test'
+        }],
+        'isError': False
+    }),
+    'prompts/list': make_template({
+        'prompts': [{
+            'name': 'test_prompt',
+            'description': 'A test prompt'
+        }]
+    }),
+    'prompts/get': make_template({
+        'description': 'Test prompt',
+        'messages': [{
+            'role': 'user',
+            'content': {'type': 'text', 'text': 'Test message'}
+        }]
+    }),
+    'resources/list': make_template({
+        'resources': [{
+            'uri': 'test://resource',
+            'name': 'test_resource',
+            'description': 'A test resource',
+            'mimeType': 'text/plain'
+        }]
+    }),
+    'resources/read': make_template({
+        'contents': [{
+            'uri': 'test://resource',
+            'mimeType': 'text/plain',
+            'text': 'Resource content'
+        }]
+    }),
+}
+
+METHOD_NOT_FOUND = make_template({
+    'code': -32601,
+    'message': 'Method not found'
+}, key='error')
+
+def handle_request(request):
+    method = request.get('method')
+    if isinstance(method, str):
+        prefix, suffix = TEMPLATES.get(method, METHOD_NOT_FOUND)
     else:
-        return {
-            'jsonrpc': '2.0',
-            'id': req_id,
-            'error': {
-                'code': -32601,
-                'message': 'Method not found'
-            }
-        }
+        prefix, suffix = METHOD_NOT_FOUND
+    return prefix + json.dumps(request['id']).encode('utf-8') + suffix
 
 # Main loop
 try:
-    for line in sys.stdin:
-        line = line.strip()
-        if not line:
-            continue
+    for batch in read_batches():
+        for line in batch:
+            if not line or line.isspace():
+                continue
 
-        request = json.loads(line)
+            request = json.loads(line)
 
-        # Handle notifications (no response needed)
-        if 'id' not in request or request['id'] is None:
-            continue
+            # Handle notifications (no response needed)
+            if 'id' not in request or request['id'] is None:
+                continue
 
-        response = handle_request(request)
-        send_response(response)
+            response = handle_request(request)
+            send_response(response)
+
+        # Requests that arrived together share one flush
+        _flush()
 
 except KeyboardInterrupt:
     pass
 except Exception as e:
+    _flush()
     sys.stderr.write(f'Error: {e}\n')
-
@@ -8,74 +8,180 @@ Simple MCP Server with one tool, one resource, and one prompt.
 Run with: uv run simple_mcp_server.py
 """
 
+from __future__ import annotations
+
 import json
 import sys
-from typing import Any, Dict
 
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, BinaryIO, Iterator
 
-def send_response(response: Dict[str, Any]) -> None:
-    """Send a JSON-RPC response to stdout."""
-    sys.stdout.write(json.dumps(response) + '\n')
-    sys.stdout.flush()
+_out = sys.stdout.buffer.write
+_flush = sys.stdout.buffer.flush
 
+# Shared default for absent params, handlers only read from it
+EMPTY_PARAMS: dict[str, Any] = {}
 
-def handle_initialize(request_id: int) -> Dict[str, Any]:
-    """Handle initialize request."""
-    return {
-        'jsonrpc': '2.0',
-        'id': request_id,
-        'result': {
-            'protocolVersion': '2024-11-05',
-            'capabilities': {
-                'tools': {},
-                'resources': {},
-                'prompts': {}
+
+def read_batches(stream: BinaryIO = sys.stdin.buffer, size: int = 65536) -> Iterator[list[bytes]]:
+    """Yield the newline-delimited frames completed by each raw stdin read."""
+    buf = bytearray()
+    while True:
+        chunk = stream.read1(size)
+        if not chunk:
+            break
+        buf += chunk
+        i = buf.rfind(b'\n')
+        if i != -1:
+            yield bytes(buf[:i]).split(b'\n')
+            del buf[:i + 1]
+    if buf:
+        yield [bytes(buf)]
+
+
+def send_response(response: bytes | dict[str, Any]) -> None:
+    """Queue a JSON-RPC response on stdout, flushed once per batch."""
+    if not isinstance(response, bytes):
+        response = json.dumps(response).encode('utf-8')
+    _out(response)
+    _out(b'\n')
+
+
+RESPONSE_PREFIX = b'{"jsonrpc": "2.0", "id": '
+
+
+def make_template(result: dict[str, Any]) -> tuple[bytes, bytes]:
+    """Pre-serialize a static response as the bytes around its id."""
+    return (
+        RESPONSE_PREFIX,
+        b', "result": ' + json.dumps(result).encode('utf-8') + b'}'
+    )
+
+
+def render_template(template: tuple[bytes, bytes], request_id: Any) -> bytes:
+    """Fill the request id into a pre-serialized response."""
+    return template[0] + json.dumps(request_id).encode('utf-8') + template[1]
+
+
+INITIALIZE_RESPONSE = make_template({
+    'protocolVersion': '2024-11-05',
+    'capabilities': {
+        'tools': {},
+        'resources': {},
+        'prompts': {}
+    },
+    'serverInfo': {
+        'name': 'simple-mcp-server',
+        'version': '1.0.0'
+    }
+})
+
+TOOLS_LIST_RESPONSE = make_template({
+    'tools': [{
+        'name': 'calculate',
+        'description': 'Performs basic arithmetic calculations',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'operation': {
+                    'type': 'string',
+                    'enum': ['add', 'subtract', 'multiply', 'divide'],
+                    'description': 'The arithmetic operation to perform'
+                },
+                'a': {
+                    'type': 'number',
+                    'description': 'First number'
+                },
+                'b': {
+                    'type': 'number',
+                    'description': 'Second number'
+                }
             },
-            'serverInfo': {
-                'name': 'simple-mcp-server',
-                'version': '1.0.0'
-            }
+            'required': ['operation', 'a', 'b']
         }
-    }
+    }]
+})
+
+TOOL_RESULT_PREFIX = b', "result": {"content": [{"type": "text", "text": '
+TOOL_RESULT_SUFFIX = b'}], "isError": false}}'
+TOOL_ERROR_SUFFIX = b'}], "isError": true}}'
+
+DIVISION_BY_ZERO_RESPONSE = make_template({
+    'content': [{
+        'type': 'text',
+        'text': 'Error: Division by zero'
+    }],
+    'isError': True
+})
+
+PROMPTS_LIST_RESPONSE = make_template({
+    'prompts': [{
+        'name': 'greeting',
+        'description': 'A friendly greeting prompt',
+        'arguments': [{
+            'name': 'name',
+            'description': 'The name to greet',
+            'required': False
+        }]
+    }]
+})
+
+RESOURCES_LIST_RESPONSE = make_template({
+    'resources': [{
+        'uri': 'info://server',
+        'name': 'Server Information',
+        'description': 'Information about this MCP server',
+        'mimeType': 'text/plain'
+    }]
+})
+
+SERVER_INFO = """Simple MCP Server v1.0.0
 
+This is a simple Model Context Protocol (MCP) server that provides:
+
+- Tool: 'calculate' - Performs basic arithmetic operations (add, subtract, multiply, divide)
+- Prompt: 'greeting' - A friendly greeting prompt
+- Resource: 'info://server' - This information document
 
-def handle_tools_list(request_id: int) -> Dict[str, Any]:
+The server implements the MCP protocol version 2024-11-05 and communicates
+via stdio using JSON-RPC 2.0.
+"""
+
+SERVER_INFO_RESPONSE = make_template({
+    'contents': [{
+        'uri': 'info://server',
+        'mimeType': 'text/plain',
+        'text': SERVER_INFO
+    }]
+})
+
+
+def render_tool_result(request_id: Any, text: str, suffix: bytes = TOOL_RESULT_SUFFIX) -> bytes:
+    """Fill the request id and text into the pre-serialized tool result."""
+    return (
+        RESPONSE_PREFIX
+        + json.dumps(request_id).encode('utf-8')
+        + TOOL_RESULT_PREFIX
+        + json.dumps(text).encode('utf-8')
+        + suffix
+    )
+
+
+def handle_initialize(request_id: int) -> bytes:
+    """Handle initialize request."""
+    return render_template(INITIALIZE_RESPONSE, request_id)
+
+
+def handle_tools_list(request_id: int) -> bytes:
     """Handle tools/list request."""
-    return {
-        'jsonrpc': '2.0',
-        'id': request_id,
-        'result': {
-            'tools': [{
-                'name': 'calculate',
-                'description': 'Performs basic arithmetic calculations',
-                'inputSchema': {
-                    'type': 'object',
-                    'properties': {
-                        'operation': {
-                            'type': 'string',
-                            'enum': ['add', 'subtract', 'multiply', 'divide'],
-                            'description': 'The arithmetic operation to perform'
-                        },
-                        'a': {
-                            'type': 'number',
-                            'description': 'First number'
-                        },
-                        'b': {
-                            'type': 'number',
-                            'description': 'Second number'
-                        }
-                    },
-                    'required': ['operation', 'a', 'b']
-                }
-            }]
-        }
-    }
+    return render_template(TOOLS_LIST_RESPONSE, request_id)
 
 
-def handle_tools_call(request_id: int, params: Dict[str, Any]) -> Dict[str, Any]:
+def handle_tools_call(request_id: int, params: dict[str, Any]) -> bytes | dict[str, Any]:
     """Handle tools/call request."""
     tool_name = params.get('name')
-    arguments = params.get('arguments', {})
+    arguments = params.get('arguments', EMPTY_PARAMS)
 
     if tool_name == 'calculate':
         operation = arguments.get('operation')
@@ -91,44 +197,14 @@ def handle_tools_call(request_id: int, params: Dict[str, Any]) -> Dict[str, Any]
                 result = a * b
             elif operation == 'divide':
                 if b == 0:
-                    return {
-                        'jsonrpc': '2.0',
-                        'id': request_id,
-                        'result': {
-                            'content': [{
-                                'type': 'text',
-                                'text': 'Error: Division by zero'
-                            }],
-                            'isError': True
-                        }
-                    }
+                    return render_template(DIVISION_BY_ZERO_RESPONSE, request_id)
                 result = a / b
             else:
                 result = 'Unknown operation'
 
-            return {
-                'jsonrpc': '2.0',
-                'id': request_id,
-                'result': {
-                    'content': [{
-                        'type': 'text',
-                        'text': f'Result: {a} {operation} {b} = {result}'
-                    }],
-                    'isError': False
-                }
-            }
+            return render_tool_result(request_id, f'Result: {a} {operation} {b} = {result}')
         except Exception as e:
-            return {
-                'jsonrpc': '2.0',
-                'id': request_id,
-                'result': {
-                    'content': [{
-                        'type': 'text',
-                        'text': f'Error: {str(e)}'
-                    }],
-                    'isError': True
-                }
-            }
+            return render_tool_result(request_id, f'Error: {e}', TOOL_ERROR_SUFFIX)
 
     return {
         'jsonrpc': '2.0',
@@ -140,29 +216,15 @@ def handle_tools_call(request_id: int, params: Dict[str, Any]) -> Dict[str, Any]
     }
 
 
-def handle_prompts_list(request_id: int) -> Dict[str, Any]:
+def handle_prompts_list(request_id: int) -> bytes:
     """Handle prompts/list request."""
-    return {
-        'jsonrpc': '2.0',
-        'id': request_id,
-        'result': {
-            'prompts': [{
-                'name': 'greeting',
-                'description': 'A friendly greeting prompt',
-                'arguments': [{
-                    'name': 'name',
-                    'description': 'The name to greet',
-                    'required': False
-                }]
-            }]
-        }
-    }
+    return render_template(PROMPTS_LIST_RESPONSE, request_id)
 
 
-def handle_prompts_get(request_id: int, params: Dict[str, Any]) -> Dict[str, Any]:
+def handle_prompts_get(request_id: int, params: dict[str, Any]) -> dict[str, Any]:
     """Handle prompts/get request."""
     prompt_name = params.get('name')
-    arguments = params.get('arguments', {})
+    arguments = params.get('arguments', EMPTY_PARAMS)
 
     if prompt_name == 'greeting':
         name = arguments.get('name', 'friend')
@@ -191,49 +253,17 @@ def handle_prompts_get(request_id: int, params: Dict[str, Any]) -> Dict[str, Any
     }
 
 
-def handle_resources_list(request_id: int) -> Dict[str, Any]:
+def handle_resources_list(request_id: int) -> bytes:
     """Handle resources/list request."""
-    return {
-        'jsonrpc': '2.0',
-        'id': request_id,
-        'result': {
-            'resources': [{
-                'uri': 'info://server',
-                'name': 'Server Information',
-                'description': 'Information about this MCP server',
-                'mimeType': 'text/plain'
-            }]
-        }
-    }
+    return render_template(RESOURCES_LIST_RESPONSE, request_id)
 
 
-def handle_resources_read(request_id: int, params: Dict[str, Any]) -> Dict[str, Any]:
+def handle_resources_read(request_id: int, params: dict[str, Any]) -> bytes | dict[str, Any]:
     """Handle resources/read request."""
     uri = params.get('uri')
 
     if uri == 'info://server':
-        info = """Simple MCP Server v1.0.0
-
-This is a simple Model Context Protocol (MCP) server that provides:
-
-- Tool: 'calculate' - Performs basic arithmetic operations (add, subtract, multiply, divide)
-- Prompt: 'greeting' - A friendly greeting prompt
-- Resource: 'info://server' - This information document
-
-The server implements the MCP protocol version 2024-11-05 and communicates
-via stdio using JSON-RPC 2.0.
-"""
-        return {
-            'jsonrpc': '2.0',
-            'id': request_id,
-            'result': {
-                'contents': [{
-                    'uri': uri,
-                    'mimeType': 'text/plain',
-                    'text': info
-                }]
-            }
-        }
+        return render_template(SERVER_INFO_RESPONSE, request_id)
 
     return {
         'jsonrpc': '2.0',
@@ -245,60 +275,65 @@ via stdio using JSON-RPC 2.0.
     }
 
 
-def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
+def handle_request(request: dict[str, Any]) -> bytes | dict[str, Any]:
     """Route request to appropriate handler."""
     method = request.get('method')
-    request_id = request.get('id')
-    params = request.get('params', {})
-
-    handlers = {
-        'initialize': lambda: handle_initialize(request_id),
-        'tools/list': lambda: handle_tools_list(request_id),
-        'tools/call': lambda: handle_tools_call(request_id, params),
-        'prompts/list': lambda: handle_prompts_list(request_id),
-        'prompts/get': lambda: handle_prompts_get(request_id, params),
-        'resources/list': lambda: handle_resources_list(request_id),
-        'resources/read': lambda: handle_resources_read(request_id, params),
-    }
-
-    handler = handlers.get(method)
-    if handler:
-        return handler()
-
-    return {
-        'jsonrpc': '2.0',
-        'id': request_id,
-        'error': {
-            'code': -32601,
-            'message': f'Method not found: {method}'
-        }
-    }
+    request_id = request['id']
+    params = request.get('params') or EMPTY_PARAMS
+
+    match method:
+        case 'initialize':
+            return handle_initialize(request_id)
+        case 'tools/list':
+            return handle_tools_list(request_id)
+        case 'tools/call':
+            return handle_tools_call(request_id, params)
+        case 'prompts/list':
+            return handle_prompts_list(request_id)
+        case 'prompts/get':
+            return handle_prompts_get(request_id, params)
+        case 'resources/list':
+            return handle_resources_list(request_id)
+        case 'resources/read':
+            return handle_resources_read(request_id, params)
+        case _:
+            return {
+                'jsonrpc': '2.0',
+                'id': request_id,
+                'error': {
+                    'code': -32601,
+                    'message': f'Method not found: {method}'
+                }
+            }
 
 
 def main():
     """Main server loop."""
     try:
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
-                continue
+        for batch in read_batches():
+            for line in batch:
+                if not line or line.isspace():
+                    continue
 
-            try:
-                request = json.loads(line)
+                try:
+                    request = json.loads(line)
 
-                # Skip notifications (requests without id)
-                if 'id' not in request or request['id'] is None:
-                    continue
+                    # Skip notifications (requests without id)
+                    if 'id' not in request or request['id'] is None:
+                        continue
+
+                    response = handle_request(request)
+                    send_response(response)
 
-                response = handle_request(request)
-                send_response(response)
+                except json.JSONDecodeError as e:
+                    sys.stderr.write(f'JSON decode error: {e}\n')
+                    sys.stderr.flush()
+                except Exception as e:
+                    sys.stderr.write(f'Error processing request: {e}\n')
+                    sys.stderr.flush()
 
-            except json.JSONDecodeError as e:
-                sys.stderr.write(f'JSON decode error: {e}\n')
-                sys.stderr.flush()
-            except Exception as e:
-                sys.stderr.write(f'Error processing request: {e}\n')
-                sys.stderr.flush()
+            # Pipelined requests that arrived together share one flush
+            _flush()
 
     except KeyboardInterrupt:
         pass
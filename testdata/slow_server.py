@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 import sys
-import time
 
-# Just read but never respond
-try:
-    for line in sys.stdin:
-        time.sleep(10)  # Simulate slow response
-except KeyboardInterrupt:
-    pass
+def main():
+    # Just read but never respond, blocking on stdin until it closes
+    try:
+        for line in sys.stdin.buffer:
+            pass
+    except KeyboardInterrupt:
+        pass
 
+if __name__ == '__main__':
+    main()
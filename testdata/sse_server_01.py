@@ -9,13 +9,7 @@
 # Use of this source code is governed by the MIT
 # license that can be found in the LICENSE file.
 
-from fastmcp import FastMCP
-
-mcp = FastMCP(name="Mut")
-
-
 # Tools
-@mcp.tool()
 def hello(name: str) -> str:
     """Greets a person by name.
 
@@ -28,7 +22,6 @@ def hello(name: str) -> str:
     return f"Hello, {name}!"
 
 
-@mcp.tool()
 def add(a: int, b: int) -> int:
     """Adds two numbers together.
 
@@ -43,7 +36,6 @@ def add(a: int, b: int) -> int:
 
 
 # Resources
-@mcp.resource("info://server")
 async def server_info() -> str:
     """Server Information resource.
 
@@ -68,7 +60,6 @@ Server built with FastMCP.
 """
 
 
-@mcp.resource("help://guide")
 async def user_guide() -> str:
     """User Guide resource.
 
@@ -97,7 +88,6 @@ For more information, visit: https://gofastmcp.com
 
 
 # Prompts
-@mcp.prompt()
 def greeting(name: str = "friend") -> list[dict]:
     """A friendly greeting prompt.
 
@@ -118,7 +108,6 @@ def greeting(name: str = "friend") -> list[dict]:
     ]
 
 
-@mcp.prompt()
 def farewell(name: str = "friend") -> list[dict]:
     """A friendly farewell prompt.
 
@@ -139,8 +128,37 @@ def farewell(name: str = "friend") -> list[dict]:
     ]
 
 
+def build_server():
+    """Builds the FastMCP server and registers the tools, resources and prompts.
+
+    fastmcp is imported here so that importing this module to inspect the
+    functions above does not load the server stack.
+
+    Returns:
+        The configured FastMCP server
+    """
+    from fastmcp import FastMCP
+
+    server = FastMCP(name="Mut")
+    server.tool()(hello)
+    server.tool()(add)
+    server.resource("info://server")(server_info)
+    server.resource("help://guide")(user_guide)
+    server.prompt()(greeting)
+    server.prompt()(farewell)
+    return server
+
+
+def __getattr__(name):
+    # Build the server on first access to `mcp`, e.g. from `fastmcp run`
+    if name == "mcp":
+        server = globals()["mcp"] = build_server()
+        return server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 if __name__ == "__main__":
-    mcp.run(
+    build_server().run(
         transport="sse",
         host="127.0.0.1",
         port=8000,